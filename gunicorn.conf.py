@@ -0,0 +1,20 @@
+"""
+Configuração do Gunicorn (servidor WSGI de produção) do ProGest2.
+
+Uso (na pasta do projeto, onde este arquivo é lido automaticamente):
+    gunicorn app:app
+
+Cada processo (worker) atende várias requisições ao mesmo tempo com threads
+(worker gthread), então requisições independentes não esperam umas pelas
+outras. O pool de conexões do SQLAlchemy é dimensionado em app.py a partir
+de WEB_THREADS.
+"""
+import os
+
+# Endereço e porta (mesmas variáveis usadas pelo servidor de desenvolvimento)
+bind = f"{os.getenv('HOST', '127.0.0.1')}:{os.getenv('PORT', '5600')}"
+
+# Processos e threads por processo
+workers = int(os.getenv('WEB_WORKERS', '4'))
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', '8'))
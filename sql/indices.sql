@@ -0,0 +1,26 @@
+-- Índices e restrições para bancos criados antes de estarem no schema.sql
+-- (bancos novos já os recebem via schema.sql / db.create_all())
+USE progest2;
+
+-- Listagem de lotes por data, mais recentes primeiro
+CREATE INDEX ix_lote_data_registro ON lote (data_registro DESC);
+
+-- Agregações do BI: somas de quantidade por propriedade e por animal
+CREATE INDEX ix_lote_prop_qty ON lote (propriedade_id, quantidade);
+CREATE INDEX ix_lote_animal_qty ON lote (animal_id, quantidade);
+
+-- Agregações do BI: área por proprietário/estado e fazendas por estado
+CREATE INDEX ix_prop_dono ON propriedade (dono_id, estado, area_total_ha);
+CREATE INDEX ix_prop_estado ON propriedade (estado);
+
+-- Agregação do BI: animais por raça
+CREATE INDEX ix_animal_raca ON animal (raca);
+
+-- Listas ordenadas por nome (selects dos formulários e listagens paginadas)
+CREATE INDEX ix_dono_nome_id ON dono (nome, id);
+CREATE INDEX ix_prop_nome ON propriedade (nome, id, municipio, estado);
+
+-- Restrições de integridade usadas pela importação em lote (bulk_insert_mappings
+-- não passa pelas validações dos formulários; o banco rejeita valores inválidos)
+ALTER TABLE propriedade ADD CONSTRAINT ck_prop_area_nao_negativa CHECK (area_total_ha >= 0);
+ALTER TABLE lote ADD CONSTRAINT ck_lote_quantidade_positiva CHECK (quantidade > 0);
@@ -7,7 +7,8 @@ CREATE TABLE IF NOT EXISTS dono (
   nome VARCHAR(80) NOT NULL,
   cpf_cnpj VARCHAR(18) NOT NULL UNIQUE,
   email VARCHAR(120),
-  telefone VARCHAR(20)
+  telefone VARCHAR(20),
+  INDEX ix_dono_nome_id (nome, id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS propriedade (
@@ -17,13 +18,18 @@ CREATE TABLE IF NOT EXISTS propriedade (
   estado VARCHAR(80) NOT NULL,
   area_total_ha DECIMAL(10,2) NOT NULL,
   dono_id INT NOT NULL,
+  INDEX ix_prop_nome (nome, id, municipio, estado),
+  INDEX ix_prop_dono (dono_id, estado, area_total_ha),
+  INDEX ix_prop_estado (estado),
+  CONSTRAINT ck_prop_area_nao_negativa CHECK (area_total_ha >= 0),
   FOREIGN KEY (dono_id) REFERENCES dono(id) ON DELETE RESTRICT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS animal (
   id INT AUTO_INCREMENT PRIMARY KEY,
   tipo VARCHAR(80) NOT NULL,
-  raca VARCHAR(80)
+  raca VARCHAR(80),
+  INDEX ix_animal_raca (raca)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS lote (
@@ -32,6 +38,10 @@ CREATE TABLE IF NOT EXISTS lote (
   animal_id INT NOT NULL,
   quantidade INT NOT NULL,
   data_registro DATE,
+  INDEX ix_lote_data_registro (data_registro DESC),
+  INDEX ix_lote_prop_qty (propriedade_id, quantidade),
+  INDEX ix_lote_animal_qty (animal_id, quantidade),
+  CONSTRAINT ck_lote_quantidade_positiva CHECK (quantidade > 0),
   FOREIGN KEY (propriedade_id) REFERENCES propriedade(id) ON DELETE CASCADE,
   FOREIGN KEY (animal_id) REFERENCES animal(id) ON DELETE RESTRICT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;